@@ -1006,10 +1006,11 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         self._decl_order[idx] = (None, self._decl_order[idx][1])
 
         # Update the ctype linked lists
-        ctype_info = self._ctypes[obj.type()]
+        _type = obj.type()
+        ctype_info = self._ctypes[_type]
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
-            del self._ctypes[obj.type()]
+            del self._ctypes[_type]
 
         # Clear the _parent attribute
         obj._parent = None
@@ -8,10 +8,13 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import logging
+import sys
+from copy import deepcopy
+
 from pyomo.core.base.numvalue import (
     NumericValue, native_numeric_types, as_numeric, value )
 import pyomo.core.base
-import logging
 
 class TemplateExpressionError(ValueError):
     def __init__(self, template, *args, **kwds):
@@ -141,7 +144,7 @@ def substitute_template_expression(expr, substituter, *args):
                     _list = list(_ptr[0])
                     _list[_ptr[1]-1] = substituter(_obj, *args)
                     _ptr[0] = tuple(_list)
-                    _ptr[3]._args = _list
+                    _ptr[3]._args = _ptr[0]
                 else:
                     _ptr[0][_ptr[1]-1] = substituter(_obj, *args)
             elif _subType in native_numeric_types or not _obj.is_expression():
@@ -179,29 +182,37 @@ def substitute_template_expression(expr, substituter, *args):
 class _GetItemIndexer(object):
     # Note that this class makes the assumption that only one template
     # ever appears in an expression for a single index
+
+    __slots__ = ('_base', '_args', '_hash')
+
     def __init__(self, expr):
         self._base = expr._base
-        self._args = []
+        _args = []
         _hash = [ id(self._base) ]
-        for x in expr._args:
-            try:
-                active_level = logging.root.manager.disable
-                logging.disable(logging.CRITICAL)
-                val = value(x)
-                self._args.append(val)
-                _hash.append(val)
-            except TemplateExpressionError as e:
-                if x is not e.template:
-                    raise TypeError(
-                        "Cannot use the param substituter with expression "
-                        "templates\nwhere the component index has the "
-                        "IndexTemplate in an expression.\n\tFound in %s"
-                        % ( expr, ))
-                self._args.append(e.template)
-                _hash.append(id(e.template._set))
-            finally:
-                logging.disable(active_level)
-
+        # Evaluating the arguments can emit (harmless) log messages, so
+        # squelch logging once around the whole loop rather than
+        # toggling the logging state for every argument.
+        active_level = logging.root.manager.disable
+        logging.disable(logging.CRITICAL)
+        try:
+            for x in expr._args:
+                try:
+                    val = value(x)
+                    _args.append(val)
+                    _hash.append(val)
+                except TemplateExpressionError as e:
+                    if x is not e.template:
+                        raise TypeError(
+                            "Cannot use the param substituter with expression "
+                            "templates\nwhere the component index has the "
+                            "IndexTemplate in an expression.\n\tFound in %s"
+                            % ( expr, ))
+                    _args.append(e.template)
+                    _hash.append(id(e.template._set))
+        finally:
+            logging.disable(active_level)
+
+        self._args = tuple(_args)
         self._hash = tuple(_hash)
 
     def __hash__(self):
@@ -294,14 +294,21 @@ class TestTemplate_expressionObjects_pyomo4\
 
 class TestTemplateSubstitution(unittest.TestCase):
 
-    def setUp(self):
-        self.m = m = ConcreteModel()
+    @classmethod
+    def setUpClass(cls):
+        # Building the model is the dominant cost of these tests, so
+        # build it once and hand each test its own clone (cloning is
+        # significantly cheaper than reconstructing from rules).
+        cls._template_m = m = ConcreteModel()
         m.TRAY = Set(initialize=range(5))
         m.TIME = Set(bounds=(0,10), initialize=range(10))
         m.y = Var(initialize=1)
         m.x = Var(m.TIME, m.TRAY, initialize=lambda _m,i,j: i)
         m.dxdt = Var(m.TIME, m.TRAY, initialize=lambda _m,i,j: 2*i)
 
+    def setUp(self):
+        self.m = self._template_m.clone()
+
     def test_simple_substitute_param(self):
         def diffeq(m,t, i):
             return m.dxdt[t, i] == t*m.x[t, i-1]**2 + m.y**2 + \